@@ -181,7 +181,7 @@ class Felix(Character, NucypherTokenActor):
             __tablename__ = 'recipient'
 
             id = self.db.Column(self.db.Integer, primary_key=True)
-            address = self.db.Column(self.db.String, nullable=False)
+            address = self.db.Column(self.db.String, nullable=False, index=True)
             joined = self.db.Column(self.db.DateTime, nullable=False, default=datetime.utcnow)
             total_received = self.db.Column(self.db.String, default='0', nullable=False)
             last_disbursement_amount = self.db.Column(self.db.String, nullable=False, default=0)
@@ -251,8 +251,8 @@ class Felix(Character, NucypherTokenActor):
             try:
                 with ThreadedSession(self.db_engine) as session:
 
-                    existing = Recipient.query.filter_by(address=new_address).all()
-                    if len(existing) > self.MAX_INDIVIDUAL_REGISTRATIONS:
+                    existing = Recipient.query.filter_by(address=new_address).count()
+                    if existing > self.MAX_INDIVIDUAL_REGISTRATIONS:
                         # Address already exists; Abort
                         self.log.debug(f"{new_address} is already enrolled {self.MAX_INDIVIDUAL_REGISTRATIONS} times.")
                         return Response(response=f"{new_address} requested too many times  -  Please use another address.", status=409)
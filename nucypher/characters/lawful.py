@@ -98,6 +98,7 @@ from nucypher.network.nodes import NodeSprout, Teacher
 from nucypher.network.protocols import InterfaceInfo, parse_node_uri
 from nucypher.network.server import ProxyRESTServer, TLSHostingPower, make_rest_app
 from nucypher.network.trackers import AvailabilityTracker
+from nucypher.utilities.concurrency import AllAtOnceFactory, WorkerPool
 from nucypher.utilities.logging import Logger
 from nucypher.utilities.networking import validate_worker_ip
 
@@ -356,12 +357,16 @@ class Alice(Character, BlockchainPolicyAuthor):
         policy_pubkey = alice_delegating_power.get_pubkey_from_label(label)
         return policy_pubkey
 
-    def revoke(self, policy) -> Dict:
+    def revoke(self, policy, timeout: Optional[float] = None) -> Dict:
         """
         Parses the treasure map and revokes arrangements in it.
         If any arrangements can't be revoked, then the node_id is added to a
         dict as a key, and the revocation and Ursula's response is added as
         a value.
+
+        The revocations are independent of each other, so they are sent to the Ursulas concurrently.
+        By default there is no deadline; if a `timeout` is given, the revocations
+        that weren't attempted in time are reported with `WorkerPool.TimedOut`.
         """
         try:
             # Wait for a revocation threshold of nodes to be known ((n - m) + 1)
@@ -374,19 +379,44 @@ class Alice(Character, BlockchainPolicyAuthor):
             raise  # TODO  NRN
 
         else:
-            failed_revocations = dict()
-            for node_id in policy.revocation_kit.revokable_addresses:
+            def worker(node_id):
                 ursula = self.known_nodes[node_id]
                 revocation = policy.revocation_kit[node_id]
                 try:
                     response = self.network_middleware.revoke_arrangement(ursula, revocation)
                 except self.network_middleware.NotFound:
-                    failed_revocations[node_id] = (revocation, self.network_middleware.NotFound)
+                    return revocation, self.network_middleware.NotFound
                 except self.network_middleware.UnexpectedResponse:
-                    failed_revocations[node_id] = (revocation, self.network_middleware.UnexpectedResponse)
-                else:
-                    if response.status_code != 200:
-                        raise self.ActorError(f"Failed to revoke {policy.id} with status code {response.status_code}")
+                    return revocation, self.network_middleware.UnexpectedResponse
+                if response.status_code != 200:
+                    raise self.ActorError(f"Failed to revoke {policy.id} with status code {response.status_code}")
+                return None
+
+            node_ids = list(policy.revocation_kit.revokable_addresses)
+            worker_pool = WorkerPool(worker=worker,
+                                     value_factory=AllAtOnceFactory(node_ids),
+                                     target_successes=len(node_ids),
+                                     timeout=timeout,
+                                     threadpool_size=len(node_ids))
+            worker_pool.start()
+
+            # Block until everything is complete. We need all the workers to finish.
+            worker_pool.join()
+
+            successes = worker_pool.get_successes()
+            failures = worker_pool.get_failures()
+
+            # Raise the same error a revocation would have raised if it was sent alone.
+            for node_id in node_ids:
+                if node_id in failures:
+                    raise failures[node_id]
+
+            failed_revocations = dict()
+            for node_id in node_ids:
+                if node_id not in successes:
+                    failed_revocations[node_id] = (policy.revocation_kit[node_id], WorkerPool.TimedOut)
+                elif successes[node_id]:
+                    failed_revocations[node_id] = successes[node_id]
 
         return failed_revocations
 
@@ -125,9 +125,25 @@ class DatastoreRecord:
             return super().__getattr__(attr)
 
         # Get the corresponding RecordField and retrieve the raw value from
-        # the db, unpack it, then use the `RecordField` to deserialize it.
+        # the db, then use the `RecordField` to deserialize it.
         record_field = self.__get_record_field(attr)
-        field_value = record_field.decode(msgpack.unpackb(self.__retrieve_raw_record(attr)))
+        return self.__deserialize_record(record_field, self.__retrieve_raw_record(attr))
+
+    def _decode_raw_record(self, attr: str, raw_value: bytes) -> Any:
+        """
+        Deserializes a raw record, as bytes, that has already been read from
+        the database for the given `attr`.
+        """
+        record_field = self.__get_record_field(attr)
+        return self.__deserialize_record(record_field, raw_value)
+
+    def __deserialize_record(self, record_field: 'RecordField', raw_value: bytes) -> Any:
+        """
+        Unpacks a raw record and deserializes it with its `RecordField.decode`
+        function. If the deserialized type doesn't match the type defined by
+        its `RecordField.field_type`, then this method will raise a `TypeError`.
+        """
+        field_value = record_field.decode(msgpack.unpackb(raw_value))
         if not type(field_value) == record_field.field_type:
             raise TypeError(f"Decoded record was type {type(field_value)}; expected {record_field.field_type}")
         return field_value
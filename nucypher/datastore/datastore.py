@@ -198,9 +198,13 @@ class Datastore:
                 # `filter_func` are both provided. In the event that the
                 # given `filter_field` doesn't exist for the record or the
                 # `filter_func` returns `False`, we call `continue`.
+                #
+                # The cursor is already positioned on the `filter_field` key of
+                # this record, so we decode its value directly rather than
+                # looking the same key up again for every record.
                 if filter_field and filter_func:
                     try:
-                        field = getattr(record(writeable=False), filter_field)
+                        field = record(writeable=False)._decode_raw_record(filter_field, db_cursor.value())
                     except (TypeError, AttributeError):
                         continue
                     else:
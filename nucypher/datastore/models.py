@@ -14,6 +14,8 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
+from functools import lru_cache
+
 from maya import MayaDT
 from umbral.keys import UmbralPublicKey
 from umbral.kfrags import KFrag
@@ -22,6 +24,13 @@ from nucypher.crypto.signing import Signature
 from nucypher.datastore.base import DatastoreRecord, RecordField
 
 
+@lru_cache(maxsize=4096)
+def _decode_umbral_public_key(key_bytes: bytes) -> UmbralPublicKey:
+    # Decoding a public key decompresses an EC point, and the same verifying
+    # keys are read from the datastore over and over, so we memoize it.
+    return UmbralPublicKey.from_bytes(key_bytes)
+
+
 class PolicyArrangement(DatastoreRecord):
     _arrangement_id = RecordField(bytes)
     _expiration = RecordField(
@@ -35,7 +44,7 @@ class PolicyArrangement(DatastoreRecord):
     _alice_verifying_key = RecordField(
             UmbralPublicKey,
             encode=bytes,
-            decode=UmbralPublicKey.from_bytes)
+            decode=_decode_umbral_public_key)
 
 
 class Workorder(DatastoreRecord):
@@ -43,7 +52,7 @@ class Workorder(DatastoreRecord):
     _bob_verifying_key = RecordField(
             UmbralPublicKey,
             encode=bytes,
-            decode=UmbralPublicKey.from_bytes)
+            decode=_decode_umbral_public_key)
     _bob_signature = RecordField(
             Signature,
             encode=bytes,
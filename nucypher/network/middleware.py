@@ -20,10 +20,14 @@ import requests
 import socket
 import ssl
 import time
-from bytestring_splitter import VariableLengthBytestring
+from collections import OrderedDict
+from threading import Lock
+
+from bytestring_splitter import VARIABLE_HEADER_LENGTH
 from constant_sorrow.constants import CERTIFICATE_NOT_SAVED, EXEMPT_FROM_VERIFICATION
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
+from requests.adapters import HTTPAdapter
 
 from nucypher.blockchain.eth.networks import NetworksInventory
 from nucypher.crypto.signing import signature_splitter
@@ -32,14 +36,41 @@ from nucypher.utilities.logging import Logger
 
 EXEMPT_FROM_VERIFICATION.bool_value(False)
 
+# Splits a re-encryption response into (CapsuleFrag, Signature) pairs.
+cfrag_and_signature_splitter = cfrag_splitter + signature_splitter
+
 
 class NucypherMiddlewareClient:
     library = requests
     timeout = 1.2
+    pool_size = 64
 
     def __init__(self, registry=None, *args, **kwargs):
         self.registry = registry
 
+        # Pooled sessions, so that connections (and their TLS handshakes) to nodes are reused across requests.
+        # A pooled connection is only checked against a certificate when it is opened,
+        # so there is a separate session for each certificate the nodes are pinned to.
+        # Only the `pool_size` most recently used sessions are kept, the others are closed.
+        self._sessions = OrderedDict()
+        self._sessions_lock = Lock()
+
+    def session_for_certificate(self, certificate_filepath) -> requests.Session:
+        with self._sessions_lock:
+            try:
+                session = self._sessions[certificate_filepath]
+            except KeyError:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size, max_retries=0)
+                session.mount("https://", adapter)
+                self._sessions[certificate_filepath] = session
+                if len(self._sessions) > self.pool_size:
+                    _evicted_filepath, evicted_session = self._sessions.popitem(last=False)
+                    evicted_session.close()
+            else:
+                self._sessions.move_to_end(certificate_filepath)
+            return session
+
     @staticmethod
     def response_cleaner(response):
         return response
@@ -93,52 +124,63 @@ class NucypherMiddlewareClient:
                             certificate_filepath=certificate_filepath)
         return response.content
 
-    def __getattr__(self, method_name):
-        # Quick sanity check.
-        if method_name not in ("post", "get", "put", "patch", "delete"):
-            raise TypeError(f"This client is for HTTP only - you need to use a real HTTP verb, not '{method_name}'.")
-
-        def method_wrapper(path,
-                           node_or_sprout=None,
-                           host=None,
-                           port=None,
-                           certificate_filepath=None,
-                           *args, **kwargs):
-            host, node_certificate_filepath, http_client = self.verify_and_parse_node_or_host_and_port(node_or_sprout, host, port)
-
-            if certificate_filepath:
-                filepaths_are_different = node_certificate_filepath != certificate_filepath
-                node_has_a_cert = node_certificate_filepath is not CERTIFICATE_NOT_SAVED
-                if node_has_a_cert and filepaths_are_different:
-                    raise ValueError("Don't try to pass a node with a certificate_filepath while also passing a"
-                                     " different certificate_filepath.  What do you even expect?")
+    def get(self, *args, **kwargs):
+        return self._http_method("get", *args, **kwargs)
+
+    def post(self, *args, **kwargs):
+        return self._http_method("post", *args, **kwargs)
+
+    def put(self, *args, **kwargs):
+        return self._http_method("put", *args, **kwargs)
+
+    def patch(self, *args, **kwargs):
+        return self._http_method("patch", *args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        return self._http_method("delete", *args, **kwargs)
+
+    def _http_method(self,
+                     method_name,
+                     path,
+                     node_or_sprout=None,
+                     host=None,
+                     port=None,
+                     certificate_filepath=None,
+                     *args, **kwargs):
+        host, node_certificate_filepath, http_client = self.verify_and_parse_node_or_host_and_port(node_or_sprout, host, port)
+
+        if certificate_filepath:
+            filepaths_are_different = node_certificate_filepath != certificate_filepath
+            node_has_a_cert = node_certificate_filepath is not CERTIFICATE_NOT_SAVED
+            if node_has_a_cert and filepaths_are_different:
+                raise ValueError("Don't try to pass a node with a certificate_filepath while also passing a"
+                                 " different certificate_filepath.  What do you even expect?")
+        else:
+            certificate_filepath = node_certificate_filepath
+
+        if http_client is self.library:
+            # Never reuse a connection that was verified against another certificate.
+            http_client = self.session_for_certificate(certificate_filepath)
+
+        method = getattr(http_client, method_name)
+
+        url = f"https://{host}/{path}"
+        response = self.invoke_method(method, url, verify=certificate_filepath, *args, **kwargs)
+        cleaned_response = self.response_cleaner(response)
+        if cleaned_response.status_code >= 300:
+            if cleaned_response.status_code == 400:
+                raise RestMiddleware.BadRequest(reason=cleaned_response.json)
+            elif cleaned_response.status_code == 404:
+                m = f"While trying to {method_name} {args} ({kwargs}), server 404'd.  Response: {cleaned_response.content}"
+                raise RestMiddleware.NotFound(m)
             else:
-                certificate_filepath = node_certificate_filepath
-
-            method = getattr(http_client, method_name)
-
-            url = f"https://{host}/{path}"
-            response = self.invoke_method(method, url, verify=certificate_filepath, *args, **kwargs)
-            cleaned_response = self.response_cleaner(response)
-            if cleaned_response.status_code >= 300:
-                if cleaned_response.status_code == 400:
-                    raise RestMiddleware.BadRequest(reason=cleaned_response.json)
-                elif cleaned_response.status_code == 404:
-                    m = f"While trying to {method_name} {args} ({kwargs}), server 404'd.  Response: {cleaned_response.content}"
-                    raise RestMiddleware.NotFound(m)
-                else:
-                    m = f"Unexpected response while trying to {method_name} {args},{kwargs}: {cleaned_response.status_code} {cleaned_response.content}"
-                    raise RestMiddleware.UnexpectedResponse(m, status=cleaned_response.status_code)
-            return cleaned_response
-
-        return method_wrapper
+                m = f"Unexpected response while trying to {method_name} {args},{kwargs}: {cleaned_response.status_code} {cleaned_response.content}"
+                raise RestMiddleware.UnexpectedResponse(m, status=cleaned_response.status_code)
+        return cleaned_response
 
     def node_selector(self, node):
         return node.rest_url(), self.library
 
-    def __len__(self):
-        return 0  # Workaround so debuggers can represent objects of this class despite the unusual __getattr__.
-
 
 class RestMiddleware:
     log = Logger()
@@ -168,31 +210,39 @@ class RestMiddleware:
     def __init__(self, registry=None):
         self.client = self._client_class(registry)
 
-    def get_certificate(self, host, port, timeout=3, retry_attempts: int = 3, retry_rate: int = 2,
-                        current_attempt: int = 0):
+    def get_certificate(self, host, port, timeout=3, retry_attempts: int = 3, retry_rate: int = 2):
+        for attempt in range(retry_attempts + 1):
+            try:
+                self.log.info(f"Fetching seednode {host}:{port} TLS certificate")
+                seednode_certificate = self._fetch_server_certificate(host=host, port=port, timeout=timeout)
+                break
 
-        socket.setdefaulttimeout(timeout)  # Set Socket Timeout
+            except socket.timeout:
+                if attempt == retry_attempts:
+                    message = f"No Response from seednode {host}:{port} after {retry_attempts} attempts"
+                    self.log.info(message)
+                    raise ConnectionRefusedError("No response from {}:{}".format(host, port))
+                self.log.info(f"No Response from seednode {host}:{port}. Retrying in {retry_rate} seconds...")
+                time.sleep(retry_rate)
 
-        try:
-            self.log.info(f"Fetching seednode {host}:{port} TLS certificate")
-            seednode_certificate = ssl.get_server_certificate(addr=(host, port))
+            except OSError:
+                raise  # TODO: #1835
 
-        except socket.timeout:
-            if current_attempt == retry_attempts:
-                message = f"No Response from seednode {host}:{port} after {retry_attempts} attempts"
-                self.log.info(message)
-                raise ConnectionRefusedError("No response from {}:{}".format(host, port))
-            self.log.info(f"No Response from seednode {host}:{port}. Retrying in {retry_rate} seconds...")
-            time.sleep(retry_rate)
-            return self.get_certificate(host, port, timeout, retry_attempts, retry_rate, current_attempt + 1)
+        certificate = x509.load_der_x509_certificate(seednode_certificate, backend=default_backend())
+        return certificate
 
-        except OSError:
-            raise  # TODO: #1835
-
-        else:
-            certificate = x509.load_pem_x509_certificate(seednode_certificate.encode(),
-                                                         backend=default_backend())
-            return certificate
+    @staticmethod
+    def _fetch_server_certificate(host, port, timeout) -> bytes:
+        """
+        Returns the DER-encoded TLS certificate presented by host:port, without verifying it.
+        The timeout only applies to this connection, unlike `socket.setdefaulttimeout`.
+        """
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        with socket.create_connection((host, port), timeout=timeout) as sock:
+            with context.wrap_socket(sock, server_hostname=host) as tls_sock:
+                return tls_sock.getpeercert(binary_form=True)
 
     def propose_arrangement(self, node, arrangement):
         response = self.client.post(node_or_sprout=node,
@@ -210,8 +260,7 @@ class RestMiddleware:
 
     def reencrypt(self, work_order):
         ursula_rest_response = self.send_work_order_payload_to_ursula(work_order)
-        splitter = cfrag_splitter + signature_splitter
-        cfrags_and_signatures = splitter.repeat(ursula_rest_response.content)
+        cfrags_and_signatures = cfrag_and_signature_splitter.repeat(ursula_rest_response.content)
         return cfrags_and_signatures
 
     def revoke_arrangement(self, ursula, revocation):
@@ -241,10 +290,9 @@ class RestMiddleware:
 
     def send_work_order_payload_to_ursula(self, work_order):
         payload = work_order.payload()
-        id_as_hex = work_order.arrangement_id.hex()
         response = self.client.post(
             node_or_sprout=work_order.ursula,
-            path=f"kFrag/{id_as_hex}/reencrypt",
+            path=f"kFrag/{work_order.arrangement_id_hex}/reencrypt",
             data=payload,
             timeout=2
         )
@@ -275,11 +323,17 @@ class RestMiddleware:
             params = {}
 
         if announce_nodes:
-            payload = bytes().join(bytes(VariableLengthBytestring(n)) for n in announce_nodes)
+            # Same encoding as joining a `VariableLengthBytestring` per node,
+            # but written into a single buffer.
+            payload = bytearray()
+            for announce_node in announce_nodes:
+                node_bytes = bytes(announce_node)
+                payload += len(node_bytes).to_bytes(VARIABLE_HEADER_LENGTH, "big")
+                payload += node_bytes
             response = self.client.post(node_or_sprout=node,
                                         path="node_metadata",
                                         params=params,
-                                        data=payload,
+                                        data=bytes(payload),
                                         )
         else:
             response = self.client.get(node_or_sprout=node,
@@ -65,6 +65,7 @@ class ProxyRESTServer:
                  ) -> None:
 
         self.rest_interface = InterfaceInfo(host=rest_host, port=rest_port)
+        self.__rest_url = self.rest_interface.uri  # The interface is fixed, and this is used for every request to the node.
         if rest_app:  # if is me
             self.rest_app = rest_app
             self.datastore = datastore
@@ -74,7 +75,7 @@ class ProxyRESTServer:
         self.__hosting_power = hosting_power
 
     def rest_url(self):
-        return "{}:{}".format(self.rest_interface.host, self.rest_interface.port)
+        return self.__rest_url
 
 
 def make_rest_app(
@@ -345,6 +345,7 @@ class WorkOrder:
                  ) -> None:
         self.bob = bob
         self.arrangement_id = arrangement_id
+        self._arrangement_id_hex = None
         self.alice_address = alice_address
         self.tasks = tasks
         self.receipt_signature = receipt_signature
@@ -354,7 +355,7 @@ class WorkOrder:
 
     def __repr__(self):
         return "WorkOrder for hrac {hrac}: (capsules: {capsule_reprs}) for {node}".format(
-            hrac=self.arrangement_id.hex()[:6],
+            hrac=self.arrangement_id_hex[:6],
             capsule_reprs=self.tasks.keys(),
             node=self.ursula
         )
@@ -365,6 +366,13 @@ class WorkOrder:
     def __len__(self):
         return len(self.tasks)
 
+    @property
+    def arrangement_id_hex(self) -> str:
+        # Memoized, since it is needed for every request related to this WorkOrder.
+        if self._arrangement_id_hex is None:
+            self._arrangement_id_hex = self.arrangement_id.hex()
+        return self._arrangement_id_hex
+
     @classmethod
     def construct_by_bob(cls, arrangement_id, alice_verifying, capsules, ursula, bob):
         ursula.mature()
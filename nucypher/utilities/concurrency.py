@@ -52,6 +52,10 @@ class SetOnce:
         self._value = None
 
     def set(self, value):
+        # Once set, the value cannot change until cleared, so there's no need to take the lock.
+        # Otherwise, the check is repeated under the lock so that two racing setters can't both win.
+        if self._set_event.is_set():
+            return
         with self._lock:
             if not self._set_event.is_set():
                 self._value = value
@@ -102,6 +106,8 @@ class WorkerPool:
         self._stagger_timeout = stagger_timeout
         self._target_successes = target_successes
 
+        # Each pool has its own thread pool, so that a long-running pool
+        # cannot hold up the workers of another one.
         thread_pool_kwargs = {}
         if threadpool_size is not None:
             thread_pool_kwargs['minthreads'] = threadpool_size
@@ -118,6 +124,8 @@ class WorkerPool:
         self._failures = {}
         self._started_tasks = 0
         self._finished_tasks = 0
+        # Written only by the result processing thread, read by the producer without the lock.
+        self._success_count = 0
 
         self._cancel_event = Event()
         self._result_queue = Queue()
@@ -191,6 +199,7 @@ class WorkerPool:
     def get_failures(self) -> Dict:
         """
         Get the current failures, as a dictionary of values to thrown exceptions.
+        The exceptions retain their tracebacks, in `__traceback__`.
         """
         with self._results_lock:
             return dict(self._failures)
@@ -224,46 +233,67 @@ class WorkerPool:
         except Cancelled as e:
             self._result_queue.put(e)
         except BaseException as e:
-            self._result_queue.put(Failure(value, str(e)))
+            # Keep the exception itself (along with its traceback),
+            # it only gets formatted if somebody actually looks at the failures.
+            self._result_queue.put(Failure(value, e))
 
     def _process_results(self):
         """
         A service thread that processes worker results
         and waits for the target number of successes to be reached.
         """
+        # Bind the attributes used on every iteration to locals, to skip the attribute lookups.
+        result_queue = self._result_queue
+        results_lock = self._results_lock
+        successes = self._successes
+        failures = self._failures
+        target_successes = self._target_successes
+        set_target_value = self._target_value.set
+
         producer_stopped = False
         success_event_reached = False
         while True:
-            result = self._result_queue.get()
-
-            if result == PRODUCER_STOPPED:
-                producer_stopped = True
-            else:
-                self._finished_tasks += 1
-                if isinstance(result, Success):
-                    with self._results_lock:
-                        self._successes[result.value] = result.result
-                        len_successes = len(self._successes)
-                    if not success_event_reached and len_successes == self._target_successes:
-                        # A protection for the case of repeating values.
-                        # Only trigger the target value once.
-                        success_event_reached = True
-                        self._target_value.set(self.get_successes())
-                if isinstance(result, Failure):
-                    with self._results_lock:
-                        self._failures[result.value] = result.exception
+            results = [result_queue.get()]
+
+            # Drain everything that has accumulated in the meantime,
+            # so that the results lock is acquired once per batch.
+            while True:
+                try:
+                    results.append(result_queue.get_nowait())
+                except Empty:
+                    break
+
+            target_value = None
+            with results_lock:
+                for result in results:
+                    if result == PRODUCER_STOPPED:
+                        producer_stopped = True
+                        continue
+
+                    self._finished_tasks += 1
+                    if isinstance(result, Success):
+                        successes[result.value] = result.result
+                        self._success_count = len(successes)
+                        if not success_event_reached and len(successes) == target_successes:
+                            # A protection for the case of repeating values.
+                            # Only trigger the target value once.
+                            success_event_reached = True
+                            target_value = dict(successes)
+                    elif isinstance(result, Failure):
+                        failures[result.value] = result.exception
+
+            if target_value is not None:
+                set_target_value(target_value)
 
             if producer_stopped and self._finished_tasks == self._started_tasks:
                 self.cancel() # to cancel the timeout thread
-                self._target_value.set(PRODUCER_STOPPED)
+                set_target_value(PRODUCER_STOPPED)
                 break
 
     def _produce_values(self):
         while True:
             try:
-                with self._results_lock:
-                    len_successes = len(self._successes)
-                batch = self._value_factory(len_successes)
+                batch = self._value_factory(self._success_count)
                 if not batch:
                     break
 
@@ -274,6 +304,10 @@ class WorkerPool:
                     # because `join()` checks that the producer thread is stopped.
                     self._threadpool.callInThread(self._worker_wrapper, value)
 
+                # No need to wait for the next batch if the factory knows there will not be one.
+                if getattr(self._value_factory, 'finished', False):
+                    break
+
                 self._sleep(self._stagger_timeout)
 
             except Cancelled:
@@ -296,6 +330,10 @@ class AllAtOnceFactory:
         self.values = values
         self._produced = False
 
+    @property
+    def finished(self) -> bool:
+        return self._produced
+
     def __call__(self, _successes):
         if self._produced:
             return None
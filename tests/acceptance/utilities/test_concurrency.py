@@ -17,6 +17,7 @@
 
 import random
 import time
+from threading import Lock
 from typing import Iterable, Tuple, List, Callable
 
 import pytest
@@ -193,6 +194,152 @@ def test_join(join_worker_pool):
     assert t_end - t_start < 3
 
 
+def test_failures_keep_exceptions(join_worker_pool):
+    """
+    Checks that the failures are reported with the original exceptions thrown by the workers.
+    """
+
+    outcomes, worker = generate_workers(
+        [
+            (WorkerRule(timeout_min=0, timeout_max=0.5), 5),
+            (WorkerRule(fails=True, timeout_min=0, timeout_max=0.5), 5),
+        ],
+        seed=123)
+
+    factory = AllAtOnceFactory(list(outcomes))
+    pool = WorkerPool(worker, factory, target_successes=5, timeout=10, threadpool_size=10)
+    join_worker_pool(pool)
+
+    pool.start()
+    pool.join()
+
+    failures = pool.get_failures()
+    assert len(failures) == 5
+    for value, exception in failures.items():
+        assert outcomes[value].fails
+        assert isinstance(exception, Exception)
+        assert str(exception) == f"Worker for {value} failed"
+        assert exception.__traceback__ is not None
+
+
+class ConcurrencyTracker:
+    """
+    A worker that sleeps for a given time and records
+    the maximum number of its instances running at the same time.
+    """
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self.running = 0
+        self.max_running = 0
+        self._lock = Lock()
+
+    def __call__(self, value):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.timeout)
+        with self._lock:
+            self.running -= 1
+        return value
+
+
+@pytest.mark.parametrize('threadpool_size', [5, 100])
+def test_threadpool_size(join_worker_pool, threadpool_size):
+    """
+    Checks that the pool runs exactly `threadpool_size` workers at the same time.
+    """
+
+    worker = ConcurrencyTracker(timeout=0.5)
+    factory = AllAtOnceFactory(list(range(threadpool_size * 2)))
+    pool = WorkerPool(worker, factory, target_successes=threadpool_size * 2, timeout=10,
+                      threadpool_size=threadpool_size)
+    join_worker_pool(pool)
+
+    pool.start()
+    pool.join()
+
+    assert worker.max_running == threadpool_size
+    assert len(pool.get_successes()) == threadpool_size * 2
+
+
+def test_pools_do_not_starve_each_other(join_worker_pool):
+    """
+    Checks that a long-running pool does not hold up the workers of another pool.
+    """
+
+    slow_worker = ConcurrencyTracker(timeout=3)
+    slow_pool = WorkerPool(slow_worker, AllAtOnceFactory(list(range(100))),
+                           target_successes=100, timeout=10, threadpool_size=100)
+    join_worker_pool(slow_pool)
+    slow_pool.start()
+
+    outcomes, worker = generate_workers([(WorkerRule(timeout_min=0, timeout_max=0.1), 10)], seed=123)
+    fast_pool = WorkerPool(worker, AllAtOnceFactory(list(outcomes)),
+                           target_successes=10, timeout=1, threadpool_size=10)
+
+    t_start = time.monotonic()
+    fast_pool.start()
+    successes = fast_pool.block_until_target_successes()
+    fast_pool.join()
+    t_end = time.monotonic()
+
+    assert len(successes) == 10
+    assert t_end - t_start < 1
+
+    # The first pool is still busy with its workers
+    assert slow_worker.running > 0
+
+
+def test_results_arriving_together(join_worker_pool):
+    """
+    Checks that results arriving in a burst are all accounted for,
+    and the target value holds exactly the target number of successes.
+    """
+
+    outcomes, worker = generate_workers(
+        [
+            (WorkerRule(), 100),
+            (WorkerRule(fails=True), 100),
+        ],
+        seed=123)
+
+    factory = AllAtOnceFactory(list(outcomes))
+    pool = WorkerPool(worker, factory, target_successes=10, timeout=10, threadpool_size=50)
+    join_worker_pool(pool)
+
+    pool.start()
+    successes = pool.block_until_target_successes()
+    pool.join()
+
+    assert len(successes) == 10
+    assert not any(outcomes[value].fails for value in successes)
+    assert len(pool.get_successes()) == 100
+    assert len(pool.get_failures()) == 100
+
+
+def test_all_at_once_factory_skips_stagger_timeout(join_worker_pool):
+    """
+    Checks that the pool does not wait out the stagger timeout
+    once `AllAtOnceFactory` has given out all its values.
+    """
+
+    outcomes, worker = generate_workers([(WorkerRule(timeout_min=0, timeout_max=0.1), 10)], seed=123)
+
+    factory = AllAtOnceFactory(list(outcomes))
+    pool = WorkerPool(worker, factory, target_successes=10, timeout=20, threadpool_size=10, stagger_timeout=10)
+    join_worker_pool(pool)
+
+    t_start = time.monotonic()
+    pool.start()
+    pool.join()
+    t_end = time.monotonic()
+
+    assert factory.finished
+    assert len(pool.get_successes()) == 10
+    assert t_end - t_start < 2
+
+
 class BatchFactory:
 
     def __init__(self, values):
@@ -216,6 +363,39 @@ class BatchFactory:
             return None
 
 
+class RecordingFactory:
+
+    def __init__(self, values, batch_size):
+        self.values = values
+        self.batch_size = batch_size
+        self.seen_successes = []
+
+    def __call__(self, successes):
+        self.seen_successes.append(successes)
+        batch = self.values[:self.batch_size]
+        self.values = self.values[self.batch_size:]
+        return batch or None
+
+
+def test_factory_sees_success_count(join_worker_pool):
+    """
+    Checks that the value factory is given the up-to-date number of successes.
+    """
+
+    outcomes, worker = generate_workers([(WorkerRule(), 20)], seed=123)
+
+    factory = RecordingFactory(list(outcomes), batch_size=5)
+    pool = WorkerPool(worker, factory, target_successes=20, timeout=10, threadpool_size=5, stagger_timeout=0.5)
+    join_worker_pool(pool)
+
+    pool.start()
+    pool.join()
+
+    # The workers finish right away, so by the time the next batch is requested
+    # the previous one is already accounted for.
+    assert factory.seen_successes == [0, 5, 10, 15, 20]
+
+
 def test_batched_value_generation(join_worker_pool):
     """
     Tests a value factory that gives out value batches in portions.
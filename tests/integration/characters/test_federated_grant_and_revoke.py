@@ -24,6 +24,7 @@ from nucypher.characters.lawful import Enrico
 from nucypher.crypto.api import keccak_digest
 from nucypher.datastore.models import PolicyArrangement
 from nucypher.policy.collections import Revocation
+from tests.utils.middleware import NodeIsDownMiddleware
 
 
 def test_federated_grant(federated_alice, federated_bob, federated_ursulas):
@@ -126,3 +127,31 @@ def test_revocation(federated_alice, federated_bob):
     # Try to revoke the already revoked policy
     already_revoked = federated_alice.revoke(policy)
     assert len(already_revoked) == 3
+
+
+def test_revocation_with_a_node_down(federated_alice, federated_bob, federated_ursulas):
+    m, n = 2, 3
+    policy_end_datetime = maya.now() + datetime.timedelta(days=5)
+    label = b"revocation test with a node down"
+
+    policy = federated_alice.grant(federated_bob, label, m=m, n=n, expiration=policy_end_datetime)
+
+    policy_ursulas = [ursula for ursula in federated_ursulas
+                      if ursula.checksum_address in policy.treasure_map.destinations]
+    down_node = policy_ursulas[0]
+
+    original_middleware = federated_alice.network_middleware
+    federated_alice.network_middleware = NodeIsDownMiddleware()
+    federated_alice.network_middleware.node_is_down(down_node)
+    try:
+        # The node being down surfaces as the same error as with a single revocation...
+        with pytest.raises(ConnectionRefusedError):
+            federated_alice.revoke(policy)
+
+        # ...but the arrangements with the other nodes were revoked regardless.
+        federated_alice.network_middleware.all_nodes_up()
+        failed_revocations = federated_alice.revoke(policy)
+        assert len(failed_revocations) == n - 1
+        assert down_node.checksum_address not in failed_revocations
+    finally:
+        federated_alice.network_middleware = original_middleware
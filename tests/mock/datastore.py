@@ -124,5 +124,11 @@ class MockCursor:
     def key(self):
         return self._keys[self._pos]
 
+    def value(self):
+        return self._tx._storage[self._keys[self._pos]]
+
     def iternext(self, keys=True, values=True):
-        return iter(self._keys[self._pos:])
+        # Like `lmdb.Cursor.iternext()`, keep the cursor on the yielded key.
+        for pos in range(self._pos, len(self._keys)):
+            self._pos = pos
+            yield self._keys[pos]
@@ -0,0 +1,188 @@
+"""
+ This file is part of nucypher.
+
+ nucypher is free software: you can redistribute it and/or modify
+ it under the terms of the GNU Affero General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ nucypher is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU Affero General Public License for more details.
+
+ You should have received a copy of the GNU Affero General Public License
+ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import shutil
+import socket
+import ssl
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from nucypher.crypto.api import generate_self_signed_certificate
+from nucypher.network.middleware import NucypherMiddlewareClient, RestMiddleware
+
+HOST = '127.0.0.1'
+
+
+def write_certificate(directory, name):
+    certificate, private_key = generate_self_signed_certificate(host=HOST, curve=ec.SECP384R1)
+    certificate_filepath = directory / f'{name}.pem'
+    key_filepath = directory / f'{name}.key'
+    certificate_filepath.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_filepath.write_bytes(private_key.private_bytes(encoding=serialization.Encoding.PEM,
+                                                       format=serialization.PrivateFormat.TraditionalOpenSSL,
+                                                       encryption_algorithm=serialization.NoEncryption()))
+    return certificate, certificate_filepath, key_filepath
+
+
+class TLSServer:
+    """
+    A local HTTPS server with a self-signed certificate that can be swapped,
+    counting the TLS connections it accepts and the ones still open.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # keep-alive
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    def __init__(self, certificate_filepath, key_filepath):
+        self.connections = 0
+        self.open_connections = 0
+        self._connections_lock = Lock()
+        self.context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self.use_certificate(certificate_filepath, key_filepath)
+
+        server = self
+
+        class CountingHTTPServer(ThreadingHTTPServer):
+            def get_request(self):
+                sock, address = super().get_request()
+                with server._connections_lock:
+                    server.connections += 1
+                    server.open_connections += 1
+                return sock, address
+
+            def shutdown_request(self, request):
+                super().shutdown_request(request)
+                with server._connections_lock:
+                    server.open_connections -= 1
+
+        self.httpd = CountingHTTPServer((HOST, 0), self.Handler)
+        self.httpd.socket = self.context.wrap_socket(self.httpd.socket, server_side=True)
+        self.port = self.httpd.server_address[1]
+        self._thread = Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def use_certificate(self, certificate_filepath, key_filepath):
+        # Only affects the handshakes from now on.
+        self.context.load_cert_chain(str(certificate_filepath), str(key_filepath))
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture(scope='function')
+def certificates(tmp_path):
+    return write_certificate(tmp_path, 'first'), write_certificate(tmp_path, 'second')
+
+
+def test_get_certificate(certificates):
+    (certificate, certificate_filepath, key_filepath), _ = certificates
+    with TLSServer(certificate_filepath, key_filepath) as server:
+        fetched_certificate = RestMiddleware().get_certificate(host=HOST, port=server.port)
+    assert fetched_certificate == certificate
+
+
+def test_get_certificate_after_the_node_changes_it(certificates):
+    (first_certificate, first_filepath, first_key), (second_certificate, second_filepath, second_key) = certificates
+    middleware = RestMiddleware()
+    with TLSServer(first_filepath, first_key) as server:
+        assert middleware.get_certificate(host=HOST, port=server.port) == first_certificate
+
+        # The node at the same host and port presents a new certificate.
+        server.use_certificate(second_filepath, second_key)
+        assert middleware.get_certificate(host=HOST, port=server.port) == second_certificate
+
+
+def test_get_certificate_from_an_unresponsive_node(mocker):
+    mocker.patch.object(RestMiddleware, '_fetch_server_certificate', side_effect=socket.timeout)
+    sleep = mocker.patch('nucypher.network.middleware.time.sleep')
+
+    with pytest.raises(ConnectionRefusedError):
+        RestMiddleware().get_certificate(host=HOST, port=1, retry_attempts=2)
+
+    assert RestMiddleware._fetch_server_certificate.call_count == 3
+    assert sleep.call_count == 2
+
+
+def test_connections_are_only_reused_for_the_same_certificate(certificates, tmp_path):
+    (_certificate, certificate_filepath, key_filepath), _ = certificates
+
+    # The same certificate, pinned under another path.
+    other_certificate_filepath = tmp_path / 'other.pem'
+    shutil.copy(certificate_filepath, other_certificate_filepath)
+
+    client = NucypherMiddlewareClient()
+    with TLSServer(certificate_filepath, key_filepath) as server:
+        for _ in range(2):
+            client.get(host=HOST, port=server.port, path='', certificate_filepath=str(certificate_filepath))
+        assert server.connections == 1
+
+        client.get(host=HOST, port=server.port, path='', certificate_filepath=str(other_certificate_filepath))
+        assert server.connections == 2
+
+        client.get(host=HOST, port=server.port, path='', certificate_filepath=str(certificate_filepath))
+        assert server.connections == 2
+
+
+def test_sessions_are_capped(certificates, tmp_path, mocker):
+    (_certificate, certificate_filepath, key_filepath), _ = certificates
+    mocker.patch.object(NucypherMiddlewareClient, 'pool_size', 3)
+
+    # The same certificate, pinned under as many paths as there are nodes.
+    certificate_filepaths = list()
+    for i in range(5):
+        node_certificate_filepath = tmp_path / f'node_{i}.pem'
+        shutil.copy(certificate_filepath, node_certificate_filepath)
+        certificate_filepaths.append(str(node_certificate_filepath))
+
+    client = NucypherMiddlewareClient()
+    sessions = list()  # Holding on to the sessions, so they're not closed by the garbage collector instead.
+    with TLSServer(certificate_filepath, key_filepath) as server:
+        for node_certificate_filepath in certificate_filepaths:
+            client.get(host=HOST, port=server.port, path='', certificate_filepath=node_certificate_filepath)
+            sessions.append(client._sessions[node_certificate_filepath])
+        assert server.connections == 5
+
+        # Only the sessions of the most recently contacted nodes are kept...
+        assert list(client._sessions) == certificate_filepaths[-3:]
+
+        # ...and the connections of the others are closed.
+        deadline = time.monotonic() + 5
+        while server.open_connections > 3 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert server.open_connections == 3
+
+        # Using a session makes it the most recent one.
+        client.get(host=HOST, port=server.port, path='', certificate_filepath=certificate_filepaths[2])
+        assert list(client._sessions) == certificate_filepaths[3:] + certificate_filepaths[2:3]
+        assert server.connections == 5
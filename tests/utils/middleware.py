@@ -106,8 +106,7 @@ class MockRestMiddleware(RestMiddleware):
                 nodes = tuple()
             return nodes
 
-    def get_certificate(self, host, port, timeout=3, retry_attempts: int = 3, retry_rate: int = 2,
-                        current_attempt: int = 0):
+    def get_certificate(self, host, port, timeout=3, retry_attempts: int = 3, retry_rate: int = 2):
         ursula = self.client._get_ursula_by_port(port)
         return ursula.certificate
 
@@ -161,8 +160,7 @@ class _MiddlewareClientWithConnectionProblems(_TestMiddlewareClient):
             if port in self.ports_that_are_down:
                 raise socket.gaierror
 
-        real_get = super(_TestMiddlewareClient, self).__getattr__("get")
-        return real_get(*args, **kwargs)
+        return super().get(*args, **kwargs)
 
 
 class NodeIsDownMiddleware(MockRestMiddleware):